@@ -4,4 +4,6 @@ __all__ = [
     "config",
     "tmdb",
     "predictor",
+    "poster_cache",
+    "thumb_store",
 ]
@@ -3,27 +3,26 @@ from __future__ import annotations
 import argparse
 import os
 from datetime import date
+from operator import itemgetter
 
 from .tmdb import TMDbClient
-from .predictor import predict_run_length_days
+from .predictor import predict_run_length_batch
 
 
 def cmd_now_playing(args):
     client = TMDbClient(api_key=args.api_key)
     movies = client.iterate_now_playing(max_pages=args.pages)
-    movies.sort(key=lambda m: m.get("popularity", 0.0), reverse=True)
+    for m in movies:
+        m.setdefault("popularity", 0.0)
+    movies.sort(key=itemgetter("popularity"), reverse=True)
     print(f"Title | Release | Popularity | Rating | Predicted End | Days Left | Confidence")
     print("-" * 100)
-    for m in movies:
-        p = predict_run_length_days(m)
+    for m, p in zip(movies, predict_run_length_batch(movies)):
         title = m.get("title") or m.get("name") or "(untitled)"
         rel = m.get("release_date") or "?"
-        pop = f"{float(m.get('popularity') or 0):.1f}"
-        rate = f"{float(m.get('vote_average') or 0):.1f} ({int(m.get('vote_count') or 0)})"
         end = p.predicted_end_date.isoformat() if p.predicted_end_date else "N/A"
         left = str(p.days_remaining) if p.days_remaining is not None else "?"
-        conf = f"{p.confidence*100:.0f}%"
-        print(f"{title} | {rel} | {pop} | {rate} | {end} | {left} | {conf}")
+        print(f"{title} | {rel} | {p.pop_str} | {p.vote_str} | {end} | {left} | {p.conf_str}")
 
 
 def build_parser() -> argparse.ArgumentParser:
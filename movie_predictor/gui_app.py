@@ -1,18 +1,99 @@
 from __future__ import annotations
 
+import queue
+import sys
 import threading
+import time
 import webbrowser
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from io import BytesIO
 from datetime import date
+from operator import itemgetter
+from typing import Dict, Optional
 from tkinter import BOTH, END, HORIZONTAL, LEFT, RIGHT, StringVar, BooleanVar, IntVar, Tk, Toplevel, VERTICAL, Canvas, Menu, ttk, messagebox
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image, ImageTk
 
 from .config import get_settings
-from .predictor import Prediction, predict_run_length_days
+from .predictor import Prediction, predict_run_length_batch
+from .thumb_store import ThumbStore
 from .tmdb import TMDbClient
-from . import __version__
+from . import __version__, poster_cache
+
+# Concurrent poster downloads; the TMDb image CDN handles parallel pulls fine
+POSTER_WORKERS = 16
+# Concurrent TMDb release-date lookups; well under the per-key rate limit
+RUN_START_WORKERS = 10
+# Process-wide pooled session for image GETs so TCP+TLS setup is paid once
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.2))
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# GUI marshalling: worker threads queue (op, payload); the Tk thread drains it
+UI_POLL_MS = 30
+UI_BATCH = 50  # rows per insert op
+UI_TICK_BUDGET = 0.008  # seconds of queued UI work per tick
+# Detail-size posters kept as PhotoImages for quick reopen; bytes stay in the disk cache
+DETAIL_PHOTOS_MAX = 10
+
+
+@dataclass(slots=True)
+class DisplayRow:
+    """A Treeview row with every column pre-formatted once per fetch."""
+    movie: Dict
+    prediction: Prediction
+    title: str
+    release: str
+    pop: str
+    vote: str
+    pred_end: str
+    left: str
+    conf: str
+    title_lower: str
+    poster_path: Optional[str]
+
+    @property
+    def values(self):
+        return (self.title, self.release, self.pop, self.vote, self.pred_end, self.left, self.conf)
+
+
+def _display_row(m: Dict, p: Prediction) -> DisplayRow:
+    return DisplayRow(
+        movie=m,
+        prediction=p,
+        title=m.get("title") or m.get("name") or "(untitled)",
+        # Show the run-start date if available
+        release=(m.get("_run_start") or m.get("release_date") or "?"),
+        # Column strings were formatted once by the predictor
+        pop=p.pop_str,
+        vote=p.vote_str,
+        pred_end=p.pred_end_str,
+        left=p.left_str,
+        conf=p.conf_str,
+        title_lower=(m.get("title") or m.get("name") or "").lower(),
+        poster_path=m.get("poster_path"),
+    )
+
+
+def _decode_poster(data: bytes, max_size, resample=Image.BILINEAR) -> Image.Image:
+    img = Image.open(BytesIO(data))
+    # JPEG fast path: let libjpeg scale down by 1/2, 1/4 or 1/8 while decoding
+    img.draft("RGB", max_size)
+    img.load()
+    # Posters are opaque; keep PhotoImage off the alpha/palette paths
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    # Only shrink sources larger than the box (w342 already fits the detail view)
+    if img.width > max_size[0] or img.height > max_size[1]:
+        img.thumbnail(max_size, resample, reducing_gap=2.0)
+    return img
 
 
 class App(Tk):
@@ -32,12 +113,22 @@ class App(Tk):
         self._tree_row_height = 300           # fit whole poster (a bit of padding)
         self._min_thumb = (60, 90)
         self._max_thumb = (360, 540)
+        self._hq_resample = False  # LANCZOS instead of BILINEAR when shrinking list posters
 
         # In-memory caches for posters (init early so callbacks can use them)
-        self._all_rows = []  # store (movie, prediction) for filtering
-        self._item_map = {}  # tree item id -> (movie, prediction)
+        self._item_map = {}  # tree item id -> DisplayRow
+        self._row_index = {}  # tree item id -> lowercased title, in list order
+        self._attached = set()  # tree item ids currently shown (not detached)
+        self._iids_by_poster = {}  # poster_path -> tree item ids showing it
+        self._suffix_index = None  # sorted [(title suffix, iid)]; rebuilt lazily after rows change
+        self._suffix_keys = []
+        self._row_order = {}  # tree item id -> position in the full list
+        self._row_images_stale = False  # rows lack current-size images (built while posters hidden)
         self._thumb_cache = {}  # size:path -> PhotoImage
-        self._poster_bytes = {}  # size:path -> bytes
+        self._thumb_store = ThumbStore()  # poster_path -> decoded RGB tile at base list size (mmap-backed)
+        self._run_start_cache = {}  # tmdb id -> run start date (or None)
+        self._detail_photos = OrderedDict()  # poster_path -> detail-size PhotoImage, LRU of DETAIL_PHOTOS_MAX
+        self._client = None  # TMDbClient reused across fetches so its caches persist
 
         settings = get_settings()
         self.api_key_var = StringVar(value=settings.tmdb_api_key or "")
@@ -55,13 +146,18 @@ class App(Tk):
         ttk.Label(top, text="Filter:").pack(side=LEFT, padx=(16, 4))
         self.filter_entry = ttk.Entry(top, textvariable=self.search_var, width=30)
         self.filter_entry.pack(side=LEFT)
-        self.filter_entry.bind("<KeyRelease>", lambda e: self._apply_filter())
+        self._filter_after_id = None
+        self._last_query = ""
+        self.filter_entry.bind("<KeyRelease>", self._on_filter_key)
 
         # Menubar with Edit options
         self.show_posters_var = BooleanVar(value=True)
         self.dark_mode_var = BooleanVar(value=False)
+        self.hq_posters_var = BooleanVar(value=self._hq_resample)
         menubar = Menu(self)
         file_menu = Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Refresh (bypass cache)", command=lambda: self.fetch_now_playing(force=True))
+        file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.destroy)
         menubar.add_cascade(label="File", menu=file_menu)
         edit_menu = Menu(menubar, tearoff=0)
@@ -70,6 +166,7 @@ class App(Tk):
         edit_menu.add_separator()
         edit_menu.add_command(label="Poster zoom +", command=lambda: self._zoom_step(+10))
         edit_menu.add_command(label="Poster zoom -", command=lambda: self._zoom_step(-10))
+        edit_menu.add_checkbutton(label="High-Quality Poster Scaling", variable=self.hq_posters_var, command=self._toggle_hq_resample)
         menubar.add_cascade(label="Edit", menu=edit_menu)
         help_menu = Menu(menubar, tearoff=0)
         help_menu.add_command(label="About", command=self._show_about)
@@ -107,103 +204,301 @@ class App(Tk):
         self.status_label = ttk.Label(self.bottom, textvariable=self.status, anchor="w")
         self.status_label.pack(side=LEFT, fill="x", expand=True)
 
-    def fetch_now_playing(self) -> None:
+        self._ui_queue = queue.Queue()
+        # Bumped per fetch; ops queued by an older fetch's worker are dropped
+        self._fetch_gen = 0
+        self.after(UI_POLL_MS, self._drain_queue)
+
+    def _drain_queue(self):
+        # Run queued UI ops until the tick's time budget is spent, so cheap ops (a
+        # poster bind is one tree.item call) go through in bulk while row batches
+        # still leave the event loop responsive
+        deadline = time.perf_counter() + UI_TICK_BUDGET
+        try:
+            while time.perf_counter() < deadline:
+                try:
+                    op, payload = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    op(payload)
+                except Exception:
+                    # One failing op must not stop the pump for everything queued after it
+                    self.report_callback_exception(*sys.exc_info())
+        finally:
+            self.after(UI_POLL_MS, self._drain_queue)
+
+    def _show_error(self, payload):
+        gen, error = payload
+        if gen != self._fetch_gen:
+            return
+        messagebox.showerror("Error", str(error))
+        self.status.set("Error")
+
+    def _append_rows(self, payload):
+        gen, rows = payload
+        if gen != self._fetch_gen:
+            return  # a newer fetch replaced this one
+        # Unmap the tree during bulk insert so Tk lays it out once, not per row
+        self.tree.pack_forget()
+        # Insert every row once; filtering only detaches/reattaches them
+        for row in rows:
+            image = self._get_thumb_image(row.poster_path) if not self._row_images_stale else None
+            if image is not None:
+                iid = self.tree.insert("", END, text="", image=image, values=row.values)
+            else:
+                iid = self.tree.insert("", END, text="", values=row.values)
+            self._item_map[iid] = row
+            self._attached.add(iid)
+            if row.poster_path:
+                self._iids_by_poster.setdefault(row.poster_path, []).append(iid)
+        # Pages arrive one at a time; keep the whole list sorted by popularity desc
+        order = sorted(self._item_map, key=lambda iid: self._item_map[iid].movie.get("popularity") or 0.0, reverse=True)
+        self._row_index = {iid: self._item_map[iid].title_lower for iid in order}
+        self._suffix_index = None
+        self._apply_filter()
+        for pos, iid in enumerate(i for i in order if i in self._attached):
+            self.tree.move(iid, "", pos)
+        self.tree.pack(fill=BOTH, expand=True, padx=8, pady=4, before=self.bottom)
+        self.status.set(f"Fetching now playing… {len(self._item_map)} movies so far")
+
+    def _poster_ready(self, payload):
+        # A poster finished loading after its rows were inserted
+        gen, poster_path = payload
+        if gen != self._fetch_gen or self._row_images_stale:
+            return
+        image = self._get_thumb_image(poster_path)
+        if image is None:
+            return
+        for iid in self._iids_by_poster.get(poster_path, ()):
+            self.tree.item(iid, image=image)
+
+    def _finish_rows(self, payload):
+        gen, count = payload
+        if gen != self._fetch_gen:
+            return
+        self.status.set(f"Loaded {count} movies. Double-click for details.")
+
+    def fetch_now_playing(self, force: bool = False) -> None:
         api_key = self.api_key_var.get().strip()
         if not api_key:
             messagebox.showwarning("TMDb API Key", "Please enter your TMDb API key. Create one at themoviedb.org.")
             return
         self.status.set("Fetching now playing…")
-        self.tree.delete(*self.tree.get_children())
-        self._all_rows.clear()
+        # A refresh mid-fetch supersedes the running worker
+        self._fetch_gen += 1
+        gen = self._fetch_gen
+        # Skip thumbnail work while posters are hidden; bind them when re-shown
+        self._row_images_stale = not self.show_posters_var.get()
+        # Detached rows are not children of the root, so delete by id
+        if self._item_map:
+            self.tree.delete(*self._item_map)
+        self._item_map.clear()
+        self._row_index.clear()
+        self._attached.clear()
+        self._iids_by_poster.clear()
+        self._suffix_index = None
 
         def worker():
-            try:
-                client = TMDbClient(api_key=api_key)
-                movies = client.iterate_now_playing(max_pages=5)
-                # Sort by popularity desc
-                movies.sort(key=lambda m: m.get("popularity", 0.0), reverse=True)
-                rows = []
-                for m in movies:
-                    # Resolve current run start date (may be a re-release)
-                    run_start = client.get_run_start_date(int(m.get("id"))) if m.get("id") else None
-                    p = predict_run_length_days({**m, "release_date": run_start.isoformat() if run_start else m.get("release_date")})
-                    rows.append(({**m, "_run_start": run_start and run_start.isoformat()}, p))
-                # Download poster thumbnails in background (use list size for cache)
-                poster_bytes = {}
-                base = f"https://image.tmdb.org/t/p/{self._list_poster_size_key}"
-                session = requests.Session()
-                for m, _ in rows:
-                    path = m.get("poster_path")
-                    if not path:
-                        continue
-                    key = f"{self._list_poster_size_key}:{path}"
-                    if key in poster_bytes or key in self._poster_bytes:
-                        continue
-                    url = f"{base}{path}"
+            size = self._list_poster_size_key
+            base = f"https://image.tmdb.org/t/p/{size}"
+            store = self._thumb_store
+            jobs = {}  # poster path -> whether the disk copy is fresh, deduplicated
+
+            def load(path):
+                # Disk read, network fetch and decode all run on the pool
+                cached = poster_cache.read_poster(size, path)
+                if cached and jobs[path]:
                     try:
-                        r = session.get(url, timeout=10)
-                        if r.ok:
-                            poster_bytes[key] = r.content
+                        store.put(path, _decode_poster(cached, self._base_thumb_max))
+                        return
                     except Exception:
-                        pass
+                        cached = None
+                etag = poster_cache.read_etag(size, path) if cached else None
+                headers = {"If-None-Match": etag} if etag else None
+                try:
+                    r = SESSION.get(f"{base}{path}", headers=headers, timeout=10)
+                    if r.status_code != 304 or not cached:
+                        r.raise_for_status()
+                except requests.RequestException:
+                    if not cached:
+                        raise
+                    # Offline or CDN error: a stale poster beats no poster
+                    r = None
+                if r is None or (r.status_code == 304 and cached):
+                    if r is not None:
+                        # Unchanged on the CDN; only headers crossed the wire
+                        poster_cache.mark_validated(size, path)
+                    if path in store:
+                        return
+                    data = cached
+                else:
+                    data = r.content
+                    poster_cache.write_poster(size, path, data, r.headers.get("ETag"))
+                # Decode here so the raw JPEG bytes never reach the UI thread
+                store.put(path, _decode_poster(data, self._base_thumb_max))
+
+            def load_and_notify(path):
+                if gen != self._fetch_gen:
+                    return
+                try:
+                    load(path)
+                except Exception:
+                    return
+                self._ui_queue.put((self._poster_ready, (gen, path)))
+
+            total = 0
+            try:
+                # Only between fetches, so tiles this fetch relies on stay put
+                store.trim()
+                client = self._client
+                if client is None or client.api_key != api_key:
+                    client = self._client = TMDbClient(api_key=api_key)
+                if force:
+                    client.clear_cache()
+                    self._run_start_cache.clear()
+                today = date.today()
+                with ThreadPoolExecutor(max_workers=RUN_START_WORKERS) as lookups, ThreadPoolExecutor(max_workers=POSTER_WORKERS) as posters:
+                    # Stream each page to the UI as it arrives instead of waiting for all of them
+                    for movies in client.iterate_now_playing_pages(max_pages=5):
+                        if gen != self._fetch_gen:
+                            break
+                        # Sort by popularity desc
+                        for m in movies:
+                            m.setdefault("popularity", 0.0)
+                        movies.sort(key=itemgetter("popularity"), reverse=True)
+                        # Resolve current run start dates (may be re-releases) concurrently
+                        ids = {int(m["id"]) for m in movies if m.get("id")}
+                        missing = [i for i in ids if i not in self._run_start_cache]
+                        for movie_id, run_start in zip(missing, lookups.map(client.get_run_start_date, missing)):
+                            self._run_start_cache[movie_id] = run_start
+                        starts = [self._run_start_cache.get(int(m.get("id"))) if m.get("id") else None for m in movies]
+                        preds = predict_run_length_batch(
+                            [{**m, "release_date": rs.isoformat() if rs else m.get("release_date")} for m, rs in zip(movies, starts)],
+                            today,
+                        )
+                        rows = [
+                            _display_row({**m, "_run_start": rs and rs.isoformat()}, p)
+                            for m, rs, p in zip(movies, starts, preds)
+                        ]
+                        for i in range(0, len(rows), UI_BATCH):
+                            self._ui_queue.put((self._append_rows, (gen, rows[i:i + UI_BATCH])))
+                        total += len(rows)
+                        # Posters load in the background and are bound to their rows when ready
+                        for row in rows:
+                            path = row.poster_path
+                            if not path or path in jobs:
+                                continue
+                            fresh = poster_cache.is_fresh(size, path)
+                            if fresh and path in store:
+                                continue
+                            jobs[path] = fresh
+                            posters.submit(load_and_notify, path)
             except Exception as e:
-                self.after(0, lambda e=e: messagebox.showerror("Error", str(e)))
-                self.after(0, lambda: self.status.set("Error"))
+                self._ui_queue.put((self._show_error, (gen, e)))
                 return
+            finally:
+                if jobs:
+                    poster_cache.prune()
+                store.flush()
 
-            def update_ui():
-                self._all_rows = rows
-                # merge newly fetched poster bytes into cache
-                self._poster_bytes.update(poster_bytes)
-                self._item_map.clear()
-                for m, p in rows:
-                    title = m.get("title") or m.get("name") or "(untitled)"
-                    # Show the run-start date if available
-                    release = (m.get("_run_start") or m.get("release_date") or "?")
-                    pop = f"{float(m.get('popularity') or 0):.1f}"
-                    vote = f"{float(m.get('vote_average') or 0):.1f} ({int(m.get('vote_count') or 0)})"
-                    # For ongoing runs, do not show an end date in the past
-                    if p.predicted_end_date and p.predicted_end_date < date.today():
-                        pred_end = "TBD"
-                    else:
-                        pred_end = p.predicted_end_date.isoformat() if p.predicted_end_date else "N/A"
-                    left = str(p.days_remaining) if (p.days_remaining is not None and p.predicted_end_date and p.predicted_end_date >= date.today()) else "?"
-                    conf = f"{p.confidence*100:.0f}%"
-                    image = self._get_thumb_image(m.get("poster_path"))
-                    if image is not None:
-                        iid = self.tree.insert("", END, text="", image=image, values=(title, release, pop, vote, pred_end, left, conf))
-                    else:
-                        iid = self.tree.insert("", END, text="", values=(title, release, pop, vote, pred_end, left, conf))
-                    self._item_map[iid] = (m, p)
-                self.status.set(f"Loaded {len(rows)} movies. Double-click for details.")
-
-            self.after(0, update_ui)
+            self._ui_queue.put((self._finish_rows, (gen, total)))
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def _on_filter_key(self, event=None):
+        # Debounce: only filter once typing pauses
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(150, self._run_pending_filter)
+
+    def _run_pending_filter(self):
+        self._filter_after_id = None
+        # Arrow keys, Shift etc. fire KeyRelease without changing the text
+        if self.search_var.get().strip().lower() == self._last_query:
+            return
+        self._apply_filter()
+
+    def _build_filter_index(self):
+        # Every suffix of every title, sorted, so a substring query becomes a
+        # bisect for the range of suffixes that start with it
+        self._suffix_index = sorted(
+            (title[i:], iid) for iid, title in self._row_index.items() for i in range(len(title))
+        )
+        self._suffix_keys = [suffix for suffix, _ in self._suffix_index]
+        self._row_order = {iid: i for i, iid in enumerate(self._row_index)}
+
+    def _match_titles(self, q):
+        if not q:
+            return set(self._row_index)
+        if len(q) < 2:
+            # Single characters match most titles; a scan is just as fast
+            return {iid for iid, title in self._row_index.items() if q in title}
+        lo = bisect_left(self._suffix_keys, q)
+        hi = bisect_left(self._suffix_keys, q + "\U0010ffff")
+        return {iid for _, iid in self._suffix_index[lo:hi]}
+
     def _apply_filter(self):
         q = self.search_var.get().strip().lower()
-        self.tree.delete(*self.tree.get_children())
-        self._item_map.clear()
-        for m, p in self._all_rows:
-            title = (m.get("title") or m.get("name") or "").lower()
-            if q and q not in title:
-                continue
-            release = (m.get("_run_start") or m.get("release_date") or "?")
-            pop = f"{float(m.get('popularity') or 0):.1f}"
-            vote = f"{float(m.get('vote_average') or 0):.1f} ({int(m.get('vote_count') or 0)})"
-            if p.predicted_end_date and p.predicted_end_date < date.today():
-                pred_end = "TBD"
-            else:
-                pred_end = p.predicted_end_date.isoformat() if p.predicted_end_date else "N/A"
-            left = str(p.days_remaining) if (p.days_remaining is not None and p.predicted_end_date and p.predicted_end_date >= date.today()) else "?"
-            conf = f"{p.confidence*100:.0f}%"
-            image = self._get_thumb_image(m.get("poster_path"))
-            if self.show_posters_var.get() and image is not None:
-                iid = self.tree.insert("", END, text="", image=image, values=(m.get("title") or m.get("name") or "(untitled)", release, pop, vote, pred_end, left, conf))
-            else:
-                iid = self.tree.insert("", END, text="", values=(m.get("title") or m.get("name") or "(untitled)", release, pop, vote, pred_end, left, conf))
-            self._item_map[iid] = (m, p)
+        self._last_query = q
+        if self._suffix_index is None:
+            self._build_filter_index()
+        matched = self._match_titles(q)
+        to_detach = self._attached - matched
+        if to_detach:
+            # One Tcl call for the whole batch
+            self.tree.detach(*to_detach)
+        to_show = matched - self._attached
+        if to_show:
+            # Rows keep their list order: walk matches in order so each reattached
+            # row lands after the matches before it
+            for pos, iid in enumerate(sorted(matched, key=self._row_order.__getitem__)):
+                if iid in to_show:
+                    self.tree.reattach(iid, "", pos)
+        self._attached = matched
+
+    def _refresh_row_images(self):
+        # Rebind thumbnails in place (zoom level changed or posters re-shown)
+        if not self.show_posters_var.get():
+            self._row_images_stale = True
+            return
+        self._row_images_stale = False
+        target = self._list_poster_max
+        hq = self._hq_resample
+        todo = [p for p in self._iids_by_poster if self._thumb_key(p, target) not in self._thumb_cache]
+        self._bind_thumbs((target, hq, {}))
+        if not todo:
+            return
+
+        def work():
+            # Read and resize off the Tk thread; only PhotoImage creation is left for it
+            resized = {}
+            for path in todo:
+                try:
+                    img = self._thumb_store.get(path)
+                    if img is not None:
+                        resized[path] = self._fit_thumb(img, target, hq)
+                except Exception:
+                    pass
+            self._ui_queue.put((self._bind_thumbs, (target, hq, resized)))
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def _bind_thumbs(self, payload):
+        target, hq, resized = payload
+        if target != self._list_poster_max or hq != self._hq_resample or self._row_images_stale:
+            return  # superseded by a later zoom step, quality switch or hidden again
+        for path, img in resized.items():
+            try:
+                self._thumb_cache[self._thumb_key(path, target)] = ImageTk.PhotoImage(img)
+            except Exception:
+                pass
+        # Rows still being resized keep their old image until theirs arrives
+        for path, iids in self._iids_by_poster.items():
+            image = self._thumb_cache.get(self._thumb_key(path, target))
+            if image is not None:
+                for iid in iids:
+                    self.tree.item(iid, image=image)
 
     def _toggle_posters(self):
         # Toggle between showing the tree (poster column) and headings-only
@@ -213,12 +508,18 @@ class App(Tk):
             _, h, wcol = self._current_thumb_dims()
             ttk.Style(self).configure("Treeview", rowheight=h)
             self.tree.column("#0", width=wcol, anchor="center")
+            if self._row_images_stale:
+                self._refresh_row_images()
         else:
+            # The poster column is hidden, so the rows can keep their images
             self.tree.configure(show="headings")
             ttk.Style(self).configure("Treeview", rowheight=28)
         # Bottom bar no-op; slider hidden for now
-        # Rebuild the rows so images are attached/detached accordingly
-        self._apply_filter()
+
+    def _toggle_hq_resample(self):
+        # Thumbnails are cached per scaling mode, so switching back is free
+        self._hq_resample = self.hq_posters_var.get()
+        self._refresh_row_images()
 
     def _zoom_step(self, delta: int):
         # Adjust zoom percent by delta and apply
@@ -265,7 +566,7 @@ class App(Tk):
         else:
             ttk.Style(self).configure("Treeview", rowheight=28)
         # Re-render rows with new thumbnail sizes
-        self._apply_filter()
+        self._refresh_row_images()
 
     def _open_details(self, event=None):
         sel = self.tree.selection()
@@ -274,7 +575,8 @@ class App(Tk):
         iid = sel[0]
         if iid not in self._item_map:
             return
-        movie, pred = self._item_map[iid]
+        display = self._item_map[iid]
+        movie, pred = display.movie, display.prediction
         win = Toplevel(self)
         win.title(movie.get("title") or movie.get("name") or "Movie Details")
         # Scrollable content container
@@ -313,18 +615,15 @@ class App(Tk):
             lbl.pack(side=LEFT, fill="x", expand=True)
 
         add_row("Title:", movie.get("title") or movie.get("name") or "")
-        add_row("Release:", movie.get("_run_start") or movie.get("release_date") or "?")
-        add_row("Popularity:", f"{float(movie.get('popularity') or 0):.1f}")
-        add_row("Rating:", f"{float(movie.get('vote_average') or 0):.1f} ({int(movie.get('vote_count') or 0)})")
+        # Reuse the strings formatted at fetch time (past end dates already shown as TBD / ?)
+        add_row("Release:", display.release)
+        add_row("Popularity:", display.pop)
+        add_row("Rating:", display.vote)
 
         if pred.predicted_end_date:
-            if pred.predicted_end_date < date.today():
-                add_row("Predicted End:", "TBD")
-                add_row("Days Remaining:", "?")
-            else:
-                add_row("Predicted End:", pred.predicted_end_date.isoformat())
-                add_row("Days Remaining:", str(pred.days_remaining))
-        add_row("Confidence:", f"{pred.confidence*100:.0f}%")
+            add_row("Predicted End:", display.pred_end)
+            add_row("Days Remaining:", display.left)
+        add_row("Confidence:", display.conf)
         # Wrap rationale for readability
         add_row("Rationale:", pred.rationale, wrap=700)
 
@@ -341,22 +640,33 @@ class App(Tk):
         req_h = min(max(content.winfo_reqheight() + 24, 420), 720)
         win.geometry(f"{req_w}x{req_h}")
 
+    def _thumb_key(self, poster_path, target):
+        # Cache key includes the target pixel size and scaling mode so each caches separately
+        mode = "hq" if self._hq_resample else "fast"
+        return f"{self._list_poster_size_key}:{target[0]}x{target[1]}:{mode}:{poster_path}"
+
+    def _fit_thumb(self, img, target, hq=None):
+        # Safe on any thread: pure PIL work on an image nobody else holds
+        tw, th = target
+        if hq is None:
+            hq = self._hq_resample
+        # Already fits (e.g. w185 at 100% zoom) means no resample needed
+        if img.width > tw or img.height > th:
+            img.thumbnail(target, Image.LANCZOS if hq else Image.BILINEAR)
+        return img
+
     def _get_thumb_image(self, poster_path):
         if not poster_path:
             return None
-        # Cache key includes the target pixel size so different slider sizes cache separately
-        cache_key = f"{self._list_poster_size_key}:{self._list_poster_max[0]}x{self._list_poster_max[1]}:{poster_path}"
+        cache_key = self._thumb_key(poster_path, self._list_poster_max)
         if cache_key in self._thumb_cache:
             return self._thumb_cache[cache_key]
-        data_key = f"{self._list_poster_size_key}:{poster_path}"
-        data = self._poster_bytes.get(data_key)
-        if not data:
-            return None
         try:
-            img = Image.open(BytesIO(data))
-            # Resize to fit our list poster target size
-            img.thumbnail(self._list_poster_max, Image.LANCZOS)
-            tk_img = ImageTk.PhotoImage(img)
+            # Posters are decoded once in the fetch worker; zoom changes only re-run the resize
+            decoded = self._thumb_store.get(poster_path)
+            if decoded is None:
+                return None
+            tk_img = ImageTk.PhotoImage(self._fit_thumb(decoded, self._list_poster_max))
             self._thumb_cache[cache_key] = tk_img
             return tk_img
         except Exception:
@@ -365,32 +675,51 @@ class App(Tk):
     def _load_detail_poster_async(self, poster_path, label_widget):
         if not poster_path:
             return
-        base = "https://image.tmdb.org/t/p/w342"
-        url = f"{base}{poster_path}"
+        cached = self._detail_photos.get(poster_path)
+        if cached is not None:
+            self._detail_photos.move_to_end(poster_path)
+            label_widget.configure(image=cached)
+            label_widget.image = cached  # keep ref
+            return
+        # Show the list thumbnail right away while the sharper poster loads
+        preview = self._get_thumb_image(poster_path)
+        if preview is not None:
+            label_widget.configure(image=preview)
+            label_widget.image = preview
+        size = "w342"
+        url = f"https://image.tmdb.org/t/p/{size}{poster_path}"
 
         def work():
-            try:
-                r = requests.get(url, timeout=15)
-                if not r.ok:
+            data = poster_cache.read_poster(size, poster_path)
+            if not data:
+                try:
+                    r = SESSION.get(url, timeout=15)
+                    if not r.ok:
+                        return
+                    data = r.content
+                except Exception:
                     return
-                data = r.content
+                poster_cache.write_poster(size, poster_path, data, r.headers.get("ETag"))
+            try:
+                img = _decode_poster(data, (360, 540), Image.LANCZOS)
             except Exception:
                 return
-
-            def set_img():
-                try:
-                    img = Image.open(BytesIO(data))
-                    img.thumbnail((360, 540), Image.LANCZOS)
-                    tk_img = ImageTk.PhotoImage(img)
-                    label_widget.configure(image=tk_img)
-                    label_widget.image = tk_img  # keep ref
-                except Exception:
-                    pass
-
-            self.after(0, set_img)
+            self._ui_queue.put((self._set_detail_poster, (poster_path, label_widget, img)))
 
         threading.Thread(target=work, daemon=True).start()
 
+    def _set_detail_poster(self, payload):
+        poster_path, label_widget, img = payload
+        try:
+            tk_img = ImageTk.PhotoImage(img)
+            self._detail_photos[poster_path] = tk_img
+            if len(self._detail_photos) > DETAIL_PHOTOS_MAX:
+                self._detail_photos.popitem(last=False)
+            label_widget.configure(image=tk_img)
+            label_widget.image = tk_img  # keep ref
+        except Exception:
+            pass
+
     def _toggle_dark_mode(self):
         dark = self.dark_mode_var.get()
         style = self.style
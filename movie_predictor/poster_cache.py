@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+import time
+from pathlib import Path
+from typing import Optional
+
+# On-disk poster store so warm starts do not re-download every image.
+CACHE_DIR = Path(os.getenv("MTLP_CACHE_DIR") or (Path.home() / ".cache" / "movie_predictor"))
+POSTER_DIR = CACHE_DIR / "posters"
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+# Entries with an ETag are revalidated (If-None-Match) once they are this old
+REVALIDATE_AFTER = 7 * 24 * 3600
+ETAG_SUFFIX = ".etag"
+
+
+def poster_cache_path(size: str, poster_path: str) -> Path:
+    # Hash the API-supplied path so it can never name a file outside the cache
+    digest = hashlib.sha1(poster_path.encode("utf-8")).hexdigest()
+    return POSTER_DIR / size / digest
+
+
+def read_poster(size: str, poster_path: str) -> Optional[bytes]:
+    path = poster_cache_path(size, poster_path)
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        # Bump mtime so eviction is least-recently-used
+        os.utime(path)
+    except OSError:
+        pass
+    return data or None
+
+
+def _etag_path(path: Path) -> Path:
+    return path.with_name(path.name + ETAG_SUFFIX)
+
+
+def read_etag(size: str, poster_path: str) -> Optional[str]:
+    try:
+        return _etag_path(poster_cache_path(size, poster_path)).read_text().strip() or None
+    except OSError:
+        return None
+
+
+def is_fresh(size: str, poster_path: str, max_age: float = REVALIDATE_AFTER) -> bool:
+    """True unless the entry has an ETag that was last validated more than max_age ago.
+
+    Entries stored without an ETag cannot be revalidated cheaply, so they never go stale.
+    """
+    try:
+        validated = _etag_path(poster_cache_path(size, poster_path)).stat().st_mtime
+    except OSError:
+        return True
+    return time.time() - validated < max_age
+
+
+def mark_validated(size: str, poster_path: str) -> None:
+    # A 304 confirmed the cached bytes; restart the revalidation clock
+    try:
+        os.utime(_etag_path(poster_cache_path(size, poster_path)))
+    except OSError:
+        pass
+
+
+def write_poster(size: str, poster_path: str, data: bytes, etag: Optional[str] = None) -> None:
+    path = poster_cache_path(size, poster_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        if etag:
+            _etag_path(path).write_text(etag)
+        else:
+            _etag_path(path).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def prune(max_bytes: int = MAX_CACHE_BYTES) -> None:
+    """Evict least-recently-used posters until the cache fits in max_bytes."""
+    entries = []
+    total = 0
+    for p in POSTER_DIR.rglob("*"):
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode) or p.name.endswith(ETAG_SUFFIX):
+            continue
+        entries.append((st.st_mtime, st.st_size, p))
+        total += st.st_size
+    if total <= max_bytes:
+        return
+    entries.sort()
+    for _, size, p in entries:
+        try:
+            p.unlink()
+            _etag_path(p).unlink(missing_ok=True)
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
@@ -2,10 +2,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
 
 
-@dataclass
+# Display formatters, bound once instead of re-parsing a format spec per call
+POP_FMT = "{:.1f}".format
+VOTE_FMT = "{:.1f} ({})".format
+CONF_FMT = "{:.0f}%".format
+RATIONALE_FMT = "base={:.0f}, pop={:.1f}, votes={:.0f}, rating={:.1f}, age_days={}, total≈{}".format
+
+
+@dataclass(frozen=True)
 class Prediction:
     predicted_end_date: Optional[date]
     days_total: Optional[int]
@@ -13,11 +21,27 @@ class Prediction:
     days_remaining: Optional[int]
     confidence: float  # 0..1
     rationale: str
+    # Display strings, formatted once at predict time. An end date already in
+    # the past shows as "TBD" with "?" days left (the run is still ongoing).
+    pop_str: str = ""
+    vote_str: str = ""
+    pred_end_str: str = "N/A"
+    left_str: str = "?"
+    conf_str: str = ""
 
 
+@lru_cache(maxsize=4096)
 def parse_date(s: Optional[str]) -> Optional[date]:
     if not s:
         return None
+    # Fast path for canonical YYYY-MM-DD only: fromisoformat (3.11+) also takes
+    # "20240102" or "2024-W01-1", which strptime("%Y-%m-%d") rejects
+    if isinstance(s, str) and len(s) == 10 and s[4] == "-" and s[7] == "-":
+        try:
+            return date.fromisoformat(s)
+        except ValueError:
+            pass
+    # Unpadded ("2024-1-2") and other forms strptime accepts
     try:
         return datetime.strptime(s, "%Y-%m-%d").date()
     except Exception:
@@ -33,17 +57,39 @@ def predict_run_length_days(movie: Dict, today: Optional[date] = None) -> Predic
 
     Inputs: TMDb movie dict with keys: release_date, popularity, vote_count, vote_average.
     """
+    return _predict_cached(
+        movie.get("release_date"),
+        movie.get("popularity"),
+        movie.get("vote_count"),
+        movie.get("vote_average"),
+        today or date.today(),
+    )
+
+
+def predict_run_length_batch(movies: Iterable[Dict], today: Optional[date] = None) -> List[Prediction]:
+    """Predict run lengths for a list of movies, reading today's date once."""
     today = today or date.today()
-    rd = parse_date(movie.get("release_date"))
+    return [predict_run_length_days(m, today) for m in movies]
+
+
+@lru_cache(maxsize=4096)
+def _predict_cached(release_date: Optional[str], popularity: Any, vote_count: Any, vote_avg: Any, today: date) -> Prediction:
+    # Keyed on exactly the inputs the heuristic reads, so refetches of the same list are free
+    pop_str = POP_FMT(float(popularity or 0.0))
+    vote_str = VOTE_FMT(float(vote_avg or 0.0), int(vote_count or 0))
+    rd = parse_date(release_date)
     if not rd:
-        return Prediction(None, None, None, None, 0.2, "Missing release date; cannot predict")
+        return Prediction(
+            None, None, None, None, 0.2, "Missing release date; cannot predict",
+            pop_str=pop_str, vote_str=vote_str, conf_str=CONF_FMT(20.0),
+        )
 
     # Base run length in the US for wide releases tends to be ~35-45 days nowadays under shifting windows.
     base = 38.0
 
-    popularity = float(movie.get("popularity") or 0.0)
-    vote_count = float(movie.get("vote_count") or 0.0)
-    vote_avg = float(movie.get("vote_average") or 0.0)
+    popularity = float(popularity or 0.0)
+    vote_count = float(vote_count or 0.0)
+    vote_avg = float(vote_avg or 0.0)
 
     # Normalize heuristics
     pop_bonus = _clamp(popularity / 100.0, 0.0, 0.6) * 30.0  # up to +18 days
@@ -72,10 +118,8 @@ def predict_run_length_days(movie: Dict, today: Optional[date] = None) -> Predic
         confidence += 0.05
     confidence = float(_clamp(confidence, 0.2, 0.95))
 
-    rationale = (
-        f"base={base:.0f}, pop={popularity:.1f}, votes={vote_count:.0f}, rating={vote_avg:.1f}, "
-        f"age_days={days_elapsed}, total≈{predicted_total}"
-    )
+    rationale = RATIONALE_FMT(base, popularity, vote_count, vote_avg, days_elapsed, predicted_total)
+    ongoing = end_date >= today
 
     return Prediction(
         predicted_end_date=end_date,
@@ -84,4 +128,9 @@ def predict_run_length_days(movie: Dict, today: Optional[date] = None) -> Predic
         days_remaining=days_remaining,
         confidence=confidence,
         rationale=rationale,
+        pop_str=pop_str,
+        vote_str=vote_str,
+        pred_end_str=end_date.isoformat() if ongoing else "TBD",
+        left_str=str(days_remaining) if ongoing else "?",
+        conf_str=CONF_FMT(confidence * 100),
     )
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from PIL import Image
+
+from .poster_cache import CACHE_DIR
+
+# Decoded list thumbnails as raw RGB tiles in one memory-mapped file, so the
+# OS page cache (not the Python heap) holds the working set across restarts.
+THUMB_FILE = CACHE_DIR / "thumbs.bin"
+INDEX_FILE = CACHE_DIR / "thumbs.json"
+MAX_STORE_BYTES = 128 * 1024 * 1024
+# Data file header: magic + random epoch. The index records the epoch it was
+# written against, so it is never applied to a different generation of tiles.
+MAGIC = b"MTLPTHB1"
+HEADER_SIZE = len(MAGIC) + 8
+
+
+class ThumbStore:
+    """Append-only store of RGB thumbnails indexed by poster path.
+
+    Several app instances may share the files. The data file is never
+    truncated in place: a reset writes a fresh file and swaps it in, and each
+    instance drops its index once the file at the path is no longer the one
+    it has open.
+    """
+
+    def __init__(self, data_file: Path = THUMB_FILE, index_file: Path = INDEX_FILE, max_bytes: int = MAX_STORE_BYTES) -> None:
+        self.data_file = data_file
+        self.index_file = index_file
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: Dict[str, Tuple[int, int, int]] = {}  # poster_path -> (offset, w, h)
+        self._mm: Optional[mmap.mmap] = None
+        self._f = None
+        self._epoch: Optional[str] = None
+        self._ident: Optional[Tuple[int, int]] = None
+        try:
+            self.data_file.parent.mkdir(parents=True, exist_ok=True)
+            self._open()
+        except OSError:
+            self._close()
+
+    def __contains__(self, poster_path: str) -> bool:
+        with self._lock:
+            return self._sync() and poster_path in self._index
+
+    def get(self, poster_path: str) -> Optional[Image.Image]:
+        with self._lock:
+            if not self._sync():
+                return None
+            entry = self._index.get(poster_path)
+            if entry is None:
+                return None
+            off, w, h = entry
+            n = w * h * 3
+            if self._mm is None or len(self._mm) < off + n:
+                self._remap()
+            # Our mapping is of the file we indexed, even if another instance
+            # has since swapped in a new one, so the tile is always the right one
+            buf = self._mm[off:off + n]
+        return Image.frombuffer("RGB", (w, h), buf, "raw", "RGB", 0, 1)
+
+    def put(self, poster_path: str, img: Image.Image) -> None:
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        data = img.tobytes()
+        with self._lock:
+            if not self._sync():
+                return
+            try:
+                # Append mode writes at the current end even if another instance
+                # appended meanwhile; the position after the write gives our offset
+                if self._f.write(data) != len(data):
+                    return
+                off = self._f.tell() - len(data)
+            except OSError:
+                return
+            self._index[poster_path] = (off, img.width, img.height)
+
+    def trim(self) -> None:
+        """Start over if the data file is past the size cap; call between fetches.
+
+        Never done inside put(), which would drop tiles that rows of the
+        current fetch were told are stored.
+        """
+        with self._lock:
+            if not self._sync():
+                return
+            try:
+                if os.fstat(self._f.fileno()).st_size > self.max_bytes:
+                    self._reset()
+            except OSError:
+                pass
+
+    def flush(self) -> None:
+        """Persist the index; call after a batch of puts."""
+        with self._lock:
+            if not self._sync():
+                return
+            try:
+                tmp = self.index_file.with_name(f"{self.index_file.name}.{os.getpid()}.tmp")
+                tmp.write_text(json.dumps({"epoch": self._epoch, "tiles": self._index}))
+                os.replace(tmp, self.index_file)
+            except OSError:
+                pass
+
+    def _open(self) -> None:
+        # (Re)open whatever data file is at the path and load the index if it
+        # was written against that file's epoch
+        self._close()
+        for _ in range(2):
+            f = open(self.data_file, "a+b", buffering=0)
+            f.seek(0)
+            header = f.read(HEADER_SIZE)
+            if len(header) == HEADER_SIZE and header.startswith(MAGIC):
+                break
+            # New, empty or pre-epoch file
+            f.close()
+            self._new_file()
+        else:
+            raise OSError(f"cannot initialise {self.data_file}")
+        st = os.fstat(f.fileno())
+        self._f = f
+        self._epoch = header[len(MAGIC):].hex()
+        self._ident = (st.st_dev, st.st_ino)
+        try:
+            raw = json.loads(self.index_file.read_text()) if self.index_file.exists() else {}
+            if raw.get("epoch") == self._epoch:
+                # Drop entries that point past the end of the data (e.g. after a crash)
+                self._index = {k: tuple(v) for k, v in raw["tiles"].items() if v[0] + v[1] * v[2] * 3 <= st.st_size}
+        except (OSError, ValueError, TypeError, KeyError, IndexError, AttributeError):
+            self._index = {}
+
+    def _sync(self) -> bool:
+        # Another instance may have reset the store since our last call
+        if self._f is None:
+            return False
+        try:
+            st = os.stat(self.data_file)
+        except OSError:
+            return True  # removed from under us; keep using the file we have open
+        if (st.st_dev, st.st_ino) != self._ident:
+            try:
+                self._open()
+            except OSError:
+                self._close()
+                return False
+        return True
+
+    def _new_file(self) -> None:
+        tmp = self.data_file.with_name(f"{self.data_file.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(MAGIC + os.urandom(HEADER_SIZE - len(MAGIC)))
+        # Replace rather than truncate: another instance may have the old file
+        # mapped, and shrinking a mapped file faults its readers
+        os.replace(tmp, self.data_file)
+        self.index_file.unlink(missing_ok=True)
+
+    def _close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+        self._index = {}
+        self._epoch = None
+        self._ident = None
+
+    def _remap(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _reset(self) -> None:
+        # Over the size cap: start over rather than compacting in place. Our own
+        # handles are closed first; Windows will not replace a file that is open.
+        self._close()
+        try:
+            self._new_file()
+        except OSError:
+            pass  # still open in another instance (Windows); retry next trim
+        self._open()
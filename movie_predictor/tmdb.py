@@ -2,13 +2,26 @@ from __future__ import annotations
 
 import os
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import get_settings
 from datetime import date, datetime
 
+__all__ = ["TMDbClient"]
+
+# Now-playing lists change slowly; reuse fetched pages for this many seconds
+NOW_PLAYING_TTL = 600.0
+# Concurrent page requests after the first (which reveals total_pages)
+PAGE_WORKERS = 4
+# Keep-alive pool: page fetches can overlap a caller's release-date lookups
+# (the GUI runs 10 at once), and a full pool discards connections
+API_POOL_SIZE = PAGE_WORKERS + 10
+
 
 class TMDbClient:
     """Lightweight TMDb v3 API client using an API key.
@@ -26,36 +39,72 @@ class TMDbClient:
             raise RuntimeError("TMDB_API_KEY is not set. Provide it via environment or .env file.")
         self._session = requests.Session()
         self._session.params = {"api_key": self.api_key}
-
-    def _get(self, path: str, params: Optional[Dict[str, Any]] = None, retries: int = 2) -> Dict[str, Any]:
+        # Keep-alive pool sized for concurrent lookups against the single API host.
+        # Retries cover rate limiting (honouring Retry-After), 5xx and connection blips.
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=API_POOL_SIZE, max_retries=retries))
+        self._np_cache: Dict[Any, Any] = {}  # (region, max_pages) -> (fetched_at, pages)
+        self._release_dates_cache: Dict[int, Dict[str, Any]] = {}
+
+    def clear_cache(self) -> None:
+        """Drop memoized now-playing pages and release dates (force refresh)."""
+        self._np_cache.clear()
+        self._release_dates_cache.clear()
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         url = f"{self.base_url}/{path.lstrip('/')}"
         merged = {"language": self.language}
         if params:
             merged.update(params)
-        for attempt in range(retries + 1):
-            resp = self._session.get(url, params=merged, timeout=20)
-            if resp.status_code == 429 and attempt < retries:
-                # rate limited
-                retry_after = int(resp.headers.get("Retry-After", "1"))
-                time.sleep(retry_after)
-                continue
-            resp.raise_for_status()
-            return resp.json()
-        # Should never reach here due to raise_for_status
-        return {}
+        # Transient failures are retried with backoff by the mounted adapter
+        resp = self._session.get(url, params=merged, timeout=20)
+        resp.raise_for_status()
+        return resp.json()
 
     def now_playing(self, page: int = 1, region: Optional[str] = None) -> Dict[str, Any]:
         region = region or self.region
         return self._get("movie/now_playing", {"page": page, "region": region})
 
-    def iterate_now_playing(self, region: Optional[str] = None, max_pages: int = 5) -> List[Dict[str, Any]]:
-        movies: List[Dict[str, Any]] = []
+    def iterate_now_playing_pages(self, region: Optional[str] = None, max_pages: int = 5) -> Iterator[List[Dict[str, Any]]]:
+        """Yield each now-playing page's results as soon as it arrives.
+
+        Complete page sets are memoized for NOW_PLAYING_TTL seconds per (region, max_pages).
+        """
+        key = (region or self.region, max_pages)
+        hit = self._np_cache.get(key)
+        if hit and time.monotonic() - hit[0] < NOW_PLAYING_TTL:
+            for results in hit[1]:
+                yield [dict(m) for m in results]
+            return
+        pages: List[List[Dict[str, Any]]] = []
         first = self.now_playing(page=1, region=region)
         total_pages = min(first.get("total_pages", 1), max_pages)
-        movies.extend(first.get("results", []))
-        for p in range(2, total_pages + 1):
-            data = self.now_playing(page=p, region=region)
-            movies.extend(data.get("results", []))
+        pages.append(first.get("results", []))
+        with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as ex:
+            # Page 1 revealed the page count; request the rest before handing page 1
+            # to the caller, so they download while it is processed. Yield in order.
+            futures = [ex.submit(self.now_playing, page=p, region=region) for p in range(2, total_pages + 1)]
+            try:
+                yield [dict(m) for m in pages[-1]]
+                for fut in futures:
+                    pages.append(fut.result().get("results", []))
+                    yield [dict(m) for m in pages[-1]]
+            finally:
+                # Caller stopped early: do not wait on pages nobody will read
+                for fut in futures:
+                    fut.cancel()
+        self._np_cache[key] = (time.monotonic(), pages)
+
+    def iterate_now_playing(self, region: Optional[str] = None, max_pages: int = 5) -> List[Dict[str, Any]]:
+        movies: List[Dict[str, Any]] = []
+        for results in self.iterate_now_playing_pages(region=region, max_pages=max_pages):
+            movies.extend(results)
         return movies
 
     def movie_details(self, movie_id: int, append: Optional[str] = None) -> Dict[str, Any]:
@@ -65,7 +114,11 @@ class TMDbClient:
         return self._get(f"movie/{movie_id}", params)
 
     def movie_release_dates(self, movie_id: int) -> Dict[str, Any]:
-        return self._get(f"movie/{movie_id}/release_dates")
+        cached = self._release_dates_cache.get(movie_id)
+        if cached is None:
+            cached = self._get(f"movie/{movie_id}/release_dates")
+            self._release_dates_cache[movie_id] = cached
+        return cached
 
     def search_movie(self, query: str, year: Optional[int] = None, page: int = 1, include_adult: bool = False) -> Dict[str, Any]:
         params: Dict[str, Any] = {"query": query, "page": page, "include_adult": include_adult}
@@ -86,44 +139,37 @@ class TMDbClient:
 
         def parse_tmdb_dt(s: str) -> Optional[date]:
             # Examples: 2022-09-02T00:00:00.000Z
-            if not s:
+            if not s or not isinstance(s, str):
                 return None
-            try:
-                # Trim Z if present
-                if s.endswith("Z"):
-                    s2 = s[:-1]
-                    try:
-                        dt = datetime.strptime(s2, "%Y-%m-%dT%H:%M:%S.%f")
-                    except ValueError:
-                        dt = datetime.strptime(s2, "%Y-%m-%dT%H:%M:%S")
-                else:
-                    try:
-                        dt = datetime.strptime(s, "%Y-%m-%dT%H:%M:%S.%f")
-                    except ValueError:
-                        dt = datetime.strptime(s, "%Y-%m-%dT%H:%M:%S")
-                return dt.date()
-            except Exception:
+            # Fast path for the canonical YYYY-MM-DD... shape: the date is the first
+            # 10 characters. fromisoformat alone would also take forms the strptime
+            # formats below reject ("20220902"), and vice versa ("2022-9-2T...")
+            if len(s) >= 10 and s[4] == s[7] == "-":
                 try:
-                    return datetime.strptime(s[:10], "%Y-%m-%d").date()
-                except Exception:
-                    return None
+                    return date.fromisoformat(s[:10])
+                except ValueError:
+                    pass
+            s2 = s[:-1] if s.endswith("Z") else s
+            for fmt in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S"):
+                try:
+                    return datetime.strptime(s2, fmt).date()
+                except ValueError:
+                    pass
+            try:
+                return datetime.strptime(s[:10], "%Y-%m-%d").date()
+            except ValueError:
+                return None
 
         def pick(results_list: List[Dict[str, Any]]) -> Optional[date]:
             theatrical_types = {2, 3}
-            candidates: List[date] = []
-            for entry in results_list or []:
-                rds = entry.get("release_dates") or []
-                for rd in rds:
-                    t = rd.get("type")
-                    if t not in theatrical_types:
-                        continue
-                    d = parse_tmdb_dt(rd.get("release_date"))
-                    if not d or d > today:
-                        continue
-                    candidates.append(d)
-            if not candidates:
-                return None
-            return sorted(candidates, reverse=True)[0]
+            dates = (
+                parse_tmdb_dt(rd.get("release_date"))
+                for entry in results_list or []
+                for rd in entry.get("release_dates") or []
+                if rd.get("type") in theatrical_types
+            )
+            # Latest past theatrical date; a single O(n) pass, no list or sort
+            return max((d for d in dates if d and d <= today), default=None)
 
         results = data.get("results") or []
         # Try region first
@@ -2,6 +2,26 @@ import os
 import pathlib
 import zipfile
 
+# Already-compressed payloads: deflating them again costs CPU for ~no size win
+STORED_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".ico", ".woff", ".woff2", ".whl", ".gz", ".exe"}
+
+
+def _compress_type(p: pathlib.Path) -> int:
+    return zipfile.ZIP_STORED if p.suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+
+
+def _walk_files(d: str):
+    # scandir's DirEntry caches file type, so no extra stat per entry (slow on NTFS)
+    subdirs = []
+    with os.scandir(d) as it:
+        for e in it:
+            if e.is_file():
+                yield pathlib.Path(e.path)
+            elif e.is_dir(follow_symlinks=False):
+                subdirs.append(e.path)
+    for sub in subdirs:
+        yield from _walk_files(sub)
+
 
 def zip_release(version: str) -> str:
     root = pathlib.Path(__file__).resolve().parents[1]
@@ -12,10 +32,10 @@ def zip_release(version: str) -> str:
     if zip_path.exists():
         zip_path.unlink()
 
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
-        for p in dist_dir.rglob("*"):
-            if p.is_file():
-                z.write(p, p.relative_to(dist_dir).as_posix())
+    files = list(_walk_files(str(dist_dir)))
+    with zipfile.ZipFile(zip_path, "w") as z:
+        for p in files:
+            z.write(p, p.relative_to(dist_dir).as_posix(), compress_type=_compress_type(p), compresslevel=1)
     return str(zip_path)
 
 